@@ -1,11 +1,22 @@
 import streamlit as st
 import os
 import json
+import re
+import hashlib
+import shutil
 import subprocess
+import sys
+import tempfile
+import time
 import webbrowser
 from datetime import datetime
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ################################
 # 0. 전역 설정(상수)
 ################################
@@ -15,6 +26,45 @@ TEMPLATES_FILE = "templates.json"
 PROMPTS_FILE = "prompts.json"
 KEYWORDS_FILE = "keywords.json"
 MKDOCS_CONFIG = "mkdocs.yml"
+MKDOCS_SETUP_STAMP = ".mkdocs_setup.stamp"
+# MkDocs 설정 구조가 바뀌면 값을 올려 기존 stamp를 무효화
+MKDOCS_SETUP_VERSION = 2
+# libyaml이 있으면 C 구현 Dumper 사용
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# 문서 파일명 패턴: 'YYYY-MM-DD-#n.md'
+_NAME_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-#(\d+)\.md$")
+
+# MkDocs 고정 설정 (nav는 mkdocs_setup에서 생성)
+_MKDOCS_BASE = {
+    "site_name": "MY-NOTE",
+    "theme": {"name": "material"},
+    "docs_dir": DOCS_DIR,
+    "plugins": ["search"],
+    "markdown_extensions": [
+        "admonition",
+        "codehilite",
+        {"toc": {"permalink": True}},
+        "footnotes",
+        "meta"
+    ]
+}
+# 고정 설정은 한 번만 직렬화해 두고 nav만 매번 직렬화
+_YAML_PREFIX: bytes = yaml.dump(
+    _MKDOCS_BASE, Dumper=YAML_DUMPER, allow_unicode=True,
+    sort_keys=False, default_flow_style=False,
+).encode("utf-8")
+
+# 날짜별 다음 문서 번호: {"YYYY-MM-DD": n}
+_next_counter: dict[str, int] = {}
+
+# 새 파일 권한 계산용 umask (스레드 간 경쟁을 피하려고 시작 시 한 번만 읽음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# 경로 존재 여부 캐시: {경로: (확인 시각, 존재 여부)}
+PATH_EXISTS_TTL = 1.0
+_path_exists_cache: dict[str, tuple[float, bool]] = {}
 
 ################################
 # 1. JSON 로드/저장 함수
@@ -23,144 +73,294 @@ def load_json(file_path: str) -> dict:
     """JSON 파일 로드."""
     if os.path.exists(file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw.decode("utf-8"))
+        except ValueError:
             return {}
     return {}
 
+@st.cache_data(show_spinner=False)
+def _cached_load_json(file_path: str, mtime_ns: int) -> dict:
+    """mtime_ns를 캐시 키로 사용하는 JSON 로드."""
+    return load_json(file_path)
+
+def load_json_cached(file_path: str) -> dict:
+    """파일 수정 시각(mtime)이 같으면 캐시된 JSON 데이터를 반환."""
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _cached_load_json(file_path, mtime_ns)
+
+def _fsync_dir(dir_path: str):
+    """디렉터리를 fsync하여 rename 결과를 디스크에 반영 (지원하지 않는 OS는 무시)."""
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 def save_json(file_path: str, data: dict):
     """JSON 데이터를 파일로 저장."""
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    # 내용이 같으면 쓰기 생략 (파일 감시에 의한 불필요한 재실행 방지)
+    try:
+        with open(file_path, "rb") as f:
+            if f.read() == payload:
+                return
+    except FileNotFoundError:
+        pass
+
+    # 임시 파일에 기록 후 교체하여 중단 시에도 기존 파일 보존
+    # (세션은 같은 프로세스의 스레드이므로 pid 대신 mkstemp로 고유 이름 사용)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path) or ".",
+        prefix=os.path.basename(file_path) + ".tmp.",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp은 0600으로 생성하므로 기존 파일 권한 유지 (새 파일은 umask 기본값)
+        try:
+            shutil.copymode(file_path, tmp_path)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(os.path.dirname(file_path) or ".")
+    _cached_load_json.clear()
+
+def path_exists_cached(path: str) -> bool:
+    """os.path.exists 결과를 PATH_EXISTS_TTL초 동안 캐시."""
+    now = time.monotonic()
+    cached = _path_exists_cache.get(path)
+    if cached is not None and now - cached[0] < PATH_EXISTS_TTL:
+        return cached[1]
+    exists = os.path.exists(path)
+    _path_exists_cache[path] = (now, exists)
+    return exists
+
+def invalidate_path_exists(path: str):
+    """경로 존재 여부 캐시에서 해당 경로 제거."""
+    _path_exists_cache.pop(path, None)
 
 ################################
 # 2. MkDocs 설정 및 필수 파일 확인
 ################################
+def _mkdocs_setup_signature() -> str:
+    """메타데이터 파일들의 inode/mtime/크기로 MkDocs 설정 서명 생성."""
+    sig = hashlib.blake2b(usedforsecurity=False)
+    sig.update(str(MKDOCS_SETUP_VERSION).encode())
+    for file_path in (METADATA_FILE, TEMPLATES_FILE, PROMPTS_FILE, KEYWORDS_FILE):
+        try:
+            stat = os.stat(file_path)
+            sig.update(f"{file_path}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        except FileNotFoundError:
+            sig.update(f"{file_path}:-;".encode())
+    return sig.hexdigest()
+
 def mkdocs_setup():
     """MkDocs 설정 파일 및 필수 파일 확인 및 생성."""
-    metadata = load_json(METADATA_FILE)
-    templates = load_json(TEMPLATES_FILE)
-    prompts = load_json(PROMPTS_FILE)
-    keywords = load_json(KEYWORDS_FILE)
-
-    # MkDocs 설정 파일 생성
-    mkdocs_config = {
-        "site_name": "MY-NOTE",
-        "theme": {"name": "material"},
-        "nav": [{"Home": "index.md"}],
-        "docs_dir": DOCS_DIR,
-        "plugins": ["search"],
-        "markdown_extensions": [
-            "admonition",
-            "codehilite",
-            {"toc": {"permalink": True}},
-            "footnotes",
-            "meta"
-        ]
-    }
-
-    # 문서 추가
-    for fname, meta in metadata.items():
-        nav_entry = {meta["title"]: fname}
-        mkdocs_config["nav"].append(nav_entry)
-
-    # 템플릿, 프롬프트, 키워드 추가
+    # 입력 파일이 바뀌지 않았으면 재생성 생략
+    signature = _mkdocs_setup_signature()
+    if os.path.exists(MKDOCS_CONFIG) and os.path.exists(os.path.join(DOCS_DIR, "index.md")):
+        try:
+            with open(MKDOCS_SETUP_STAMP, "r", encoding="utf-8") as f:
+                if f.read().strip() == signature:
+                    return
+        except FileNotFoundError:
+            pass
+
+    metadata = load_json_cached(METADATA_FILE)
+    templates = load_json_cached(TEMPLATES_FILE)
+    prompts = load_json_cached(PROMPTS_FILE)
+    keywords = load_json_cached(KEYWORDS_FILE)
+
+    # 문서, 템플릿, 프롬프트, 키워드 nav 구성
+    nav_entries = [{"Home": "index.md"}] + [{meta["title"]: fname} for fname, meta in metadata.items()]
     if templates:
-        mkdocs_config["nav"].append({"Templates": "templates.md"})
+        nav_entries.append({"Templates": "templates.md"})
     if prompts:
-        mkdocs_config["nav"].append({"Prompts": "prompts.md"})
+        nav_entries.append({"Prompts": "prompts.md"})
     if keywords:
-        mkdocs_config["nav"].append({"Keywords": "keywords.md"})
+        nav_entries.append({"Keywords": "keywords.md"})
 
     # 설정 파일 저장
-    with open(MKDOCS_CONFIG, "w", encoding="utf-8") as f:
-        yaml.dump(mkdocs_config, f, allow_unicode=True)
+    nav_yaml = yaml.dump({"nav": nav_entries}, Dumper=YAML_DUMPER, allow_unicode=True,
+                         sort_keys=False, default_flow_style=False)
+    with open(MKDOCS_CONFIG, "wb") as f:
+        f.write(_YAML_PREFIX + nav_yaml.encode("utf-8"))
 
     # 필수 파일 확인 및 생성
-    if not os.path.exists(DOCS_DIR):
-        os.makedirs(DOCS_DIR)
+    os.makedirs(DOCS_DIR, exist_ok=True)
     index_file_path = os.path.join(DOCS_DIR, "index.md")
     if not os.path.exists(index_file_path):
         with open(index_file_path, "w", encoding="utf-8") as f:
             f.write("# Welcome to MY-NOTE\n\nThis is your project's index page.")
 
+    with open(MKDOCS_SETUP_STAMP, "w", encoding="utf-8") as f:
+        f.write(signature)
+
 ################################
 # 3. 문서 CRUD
 ################################
+def load_metadata() -> dict:
+    """metadata.json 로드 후 반복되는 태그/카테고리 문자열을 intern."""
+    metadata = load_json_cached(METADATA_FILE)
+    for doc_meta in metadata.values():
+        # 키가 없거나 형식이 다른 항목은 그대로 둠
+        tags = doc_meta.get("tags")
+        if isinstance(tags, list):
+            doc_meta["tags"] = [sys.intern(tag) if isinstance(tag, str) else tag for tag in tags]
+        category = doc_meta.get("category")
+        if isinstance(category, str):
+            doc_meta["category"] = sys.intern(category)
+    return metadata
+
 def generate_filename() -> str:
     """'YYYY-MM-DD-#n.md' 형태로 파일명을 생성."""
-    if not os.path.exists(DOCS_DIR):
-        os.makedirs(DOCS_DIR)
+    os.makedirs(DOCS_DIR, exist_ok=True)
     date_str = datetime.now().strftime("%Y-%m-%d")
-    counter = 1
-    while True:
-        filename = f"{date_str}-#{counter}.md"
-        if not os.path.exists(os.path.join(DOCS_DIR, filename)):
-            return filename
+    counter = _next_counter.get(date_str)
+    if counter is None:
+        # 날짜별 최초 호출 시 한 번만 폴더를 스캔해 최대 번호 확인
+        counter = 1
+        with os.scandir(DOCS_DIR) as it:
+            for entry in it:
+                match = _NAME_RE.match(entry.name)
+                if match and match.group(1) == date_str:
+                    counter = max(counter, int(match.group(2)) + 1)
+    # 다른 세션/프로세스가 만든 파일과 겹치지 않도록 확인
+    while os.path.exists(os.path.join(DOCS_DIR, f"{date_str}-#{counter}.md")):
         counter += 1
+    _next_counter[date_str] = counter + 1
+    return f"{date_str}-#{counter}.md"
+
+def create_document(title: str, category: str, tags: list, content: str,
+                    metadata: dict = None, save: bool = True) -> str:
+    """새 문서를 생성하고 metadata.json에 등록.
 
-def create_document(title: str, category: str, tags: list, content: str) -> str:
-    """새 문서를 생성하고 metadata.json에 등록."""
-    metadata = load_json(METADATA_FILE)
+    이미 로드한 metadata를 넘기면 다시 읽지 않고 해당 dict를 갱신합니다.
+    """
+    if metadata is None:
+        metadata = load_metadata()
     file_name = generate_filename()
+    # 중복 태그 제거 (순서 유지)
+    tags = list(dict.fromkeys(sys.intern(tag) for tag in tags))
 
-    front_matter = [
-        "---",
-        f'title: "{title}"',
-        f'category: "{category}"',
-        f'tags: {tags}',
-        "---\n"
-    ]
+    front_matter = yaml.dump(
+        {"title": title, "category": category, "tags": tags},
+        Dumper=YAML_DUMPER, allow_unicode=True, sort_keys=False, default_flow_style=False,
+    )
     file_path = os.path.join(DOCS_DIR, file_name)
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(front_matter))
+        f.write(f"---\n{front_matter}---\n")
         f.write(content)
+    invalidate_path_exists(file_path)
 
     metadata[file_name] = {
         "title": title,
         "category": category,
         "tags": tags
     }
-    save_json(METADATA_FILE, metadata)
+    if save:
+        save_json(METADATA_FILE, metadata)
 
     return file_name
 
+# 수정/삭제된 문서의 이전 본문이 계속 쌓이지 않도록 항목 수 제한
+@st.cache_data(show_spinner=False, max_entries=128)
+def _read_md(file_path: str, mtime_ns: int) -> str:
+    """mtime_ns를 캐시 키로 사용하는 Markdown 파일 로드."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
 def load_markdown_file(file_name: str) -> str:
     """Markdown 파일 로드."""
     file_path = os.path.join(DOCS_DIR, file_name)
-    if os.path.exists(file_path):
+    try:
         with open(file_path, "r", encoding="utf-8") as f:
             return f.read()
-    return ""
+    except FileNotFoundError:
+        return ""
+
+def delete_document(file_name: str, metadata: dict = None, save: bool = True):
+    """문서를 삭제하고 metadata.json에서 제거.
 
-def delete_document(file_name: str):
-    """문서를 삭제하고 metadata.json에서 제거."""
-    metadata = load_json(METADATA_FILE)
+    이미 로드한 metadata를 넘기면 다시 읽지 않고 해당 dict를 갱신합니다.
+    """
+    if metadata is None:
+        metadata = load_metadata()
     if file_name in metadata:
         del metadata[file_name]
-        save_json(METADATA_FILE, metadata)
+        if save:
+            save_json(METADATA_FILE, metadata)
     file_path = os.path.join(DOCS_DIR, file_name)
-    if os.path.exists(file_path):
+    try:
         os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    invalidate_path_exists(file_path)
 
 ################################
 # 4. MkDocs 관리 함수
 ################################
+def _mkdocs_run(command: str):
+    """MkDocs 명령을 하위 프로세스 없이 현재 프로세스에서 실행 (build, gh-deploy)."""
+    from mkdocs.commands.build import build
+    from mkdocs.commands.gh_deploy import gh_deploy
+    from mkdocs.config import load_config
+
+    cfg = load_config(MKDOCS_CONFIG)
+    cfg.plugins.on_startup(command=command, dirty=False)
+    try:
+        build(cfg)
+        if command == "gh-deploy":
+            gh_deploy(cfg)
+    finally:
+        cfg.plugins.on_shutdown()
+
 def mkdocs_build():
     """MkDocs 빌드."""
     mkdocs_setup()
     try:
-        subprocess.run(["mkdocs", "build"], check=True)
+        _mkdocs_run("build")
         return "MkDocs 빌드 완료!"
-    except subprocess.CalledProcessError as e:
+    except (Exception, SystemExit) as e:
         return f"빌드 오류 발생: {e}"
 
 def mkdocs_serve():
     """MkDocs 로컬 테스트."""
+    # 실행 중인 서버도 변경된 mkdocs.yml을 다시 읽도록 먼저 설정 갱신
     mkdocs_setup()
+    proc = st.session_state.get("mkdocs_serve_proc")
+    if proc is not None and proc.poll() is None:
+        # 이미 실행 중인 서버가 있으면 새로 띄우지 않음
+        webbrowser.open("http://127.0.0.1:8000")
+        return "MkDocs 로컬 테스트 서버가 이미 시작되어 있습니다."
+
     try:
-        subprocess.Popen(["mkdocs", "serve"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        st.session_state.mkdocs_serve_proc = subprocess.Popen(
+            [sys.executable, "-m", "mkdocs", "serve"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         webbrowser.open("http://127.0.0.1:8000")
         return "MkDocs 로컬 테스트 서버가 시작되었습니다."
     except Exception as e:
@@ -170,34 +370,51 @@ def mkdocs_deploy():
     """MkDocs 배포."""
     mkdocs_setup()
     try:
-        subprocess.run(["mkdocs", "gh-deploy"], check=True)
+        _mkdocs_run("gh-deploy")
         return "MkDocs 배포 완료! GitHub Pages에서 확인하세요."
-    except subprocess.CalledProcessError as e:
+    except (Exception, SystemExit) as e:
         return f"배포 오류 발생: {e}"
 
 ################################
 # 6. Markdown 파일 병합 함수
 ################################
+def _scan_md_files(folder_path: str):
+    """폴더를 재귀적으로 탐색하며 .md 파일 경로를 경로순으로 반환 (심볼릭 링크 제외)."""
+    try:
+        with os.scandir(folder_path) as it:
+            entries = sorted(it, key=lambda e: e.path)
+    except OSError:
+        # os.walk와 마찬가지로 읽을 수 없는 폴더는 건너뜀
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_md_files(entry.path)
+        elif entry.name.endswith('.md') and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
 def merge_md_files(folder_path: str, output_file: str):
     """
     특정 폴더 내 모든 .md 파일을 합쳐 하나의 파일로 저장합니다.
     """
-    if not os.path.exists(folder_path):
+    if not path_exists_cached(folder_path):
         return f"지정된 폴더가 존재하지 않습니다: {folder_path}"
 
     try:
-        with open(output_file, 'w', encoding='utf-8') as outfile:
-            outfile.write(f"# MERGED Overview ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n\n")
-            outfile.write(f"합쳐진 폴더: {folder_path}\n\n")
-            
-            for root, _, files in os.walk(folder_path):
-                for file in files:
-                    if file.endswith('.md'):
-                        file_path = os.path.join(root, file)
-                        with open(file_path, 'r', encoding='utf-8') as infile:
-                            outfile.write(f"## {file}\n\n")
-                            outfile.write(infile.read() + '\n\n')
-                            outfile.write('-' * 40 + '\n\n')
+        with open(output_file, 'wb') as outfile:
+            outfile.write(f"# MERGED Overview ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n\n".encode('utf-8'))
+            outfile.write(f"합쳐진 폴더: {folder_path}\n\n".encode('utf-8'))
+
+            output_real = os.path.realpath(output_file)
+            for file_path in _scan_md_files(folder_path):
+                # 출력 파일이 폴더 안에 있으면 자기 자신을 복사하지 않도록 제외
+                if os.path.realpath(file_path) == output_real:
+                    continue
+                file = os.path.basename(file_path)
+                outfile.write(f"## {file}\n\n".encode('utf-8'))
+                # 디코딩/인코딩 없이 바이트 단위로 복사
+                with open(file_path, 'rb') as infile:
+                    shutil.copyfileobj(infile, outfile, length=1024 * 1024)
+                outfile.write(b'\n\n' + b'-' * 40 + b'\n\n')
         return f"Merged 파일이 성공적으로 생성되었습니다: {output_file}"
     except Exception as e:
         return f"파일 병합 중 오류 발생: {e}"
@@ -206,6 +423,38 @@ def merge_md_files(folder_path: str, output_file: str):
 ################################
 # 5. Streamlit 메인
 ################################
+def scan_docs_dir() -> dict:
+    """DOCS_DIR을 한 번 스캔해 {파일명: DirEntry} 반환."""
+    try:
+        with os.scandir(DOCS_DIR) as it:
+            return {entry.name: entry for entry in it if entry.is_file(follow_symlinks=False)}
+    except FileNotFoundError:
+        return {}
+
+@st.fragment
+def render_document_viewer(metadata: dict):
+    """선택한 문서 하나의 본문만 로드해 표시 (선택 변경 시 이 영역만 다시 실행)."""
+    entries = scan_docs_dir()
+    # 실제 파일이 없는 문서는 목록에서 제외
+    names = [name for name in metadata if name in entries]
+    if not names:
+        st.info("표시할 문서 파일이 없습니다.")
+        return
+    fname = st.selectbox(
+        "문서 선택",
+        names,
+        format_func=lambda name: f"{metadata[name]['title']} ({name})",
+    )
+    doc_meta = metadata[fname]
+    st.write(f"**카테고리:** {doc_meta['category']}")
+    st.write(f"**태그:** {', '.join(doc_meta['tags'])}")
+    entry = entries[fname]
+    try:
+        content = _read_md(entry.path, entry.stat(follow_symlinks=False).st_mtime_ns)
+    except FileNotFoundError:
+        content = ""
+    st.text_area("문서 내용", value=content, height=200, disabled=True)
+
 def main():
     st.title("MY-NOTE")
     st.sidebar.title("메뉴")
@@ -225,16 +474,11 @@ def main():
         st.header("문서 관리")
         action = st.selectbox("작업 선택", ["보기", "추가", "수정", "삭제"])
 
-        metadata = load_json(METADATA_FILE)
+        metadata = load_metadata()
         if action == "보기":
             st.subheader("문서 보기")
             if metadata:
-                for fname, doc_meta in metadata.items():
-                    with st.expander(f"{doc_meta['title']} ({fname})"):
-                        st.write(f"**카테고리:** {doc_meta['category']}")
-                        st.write(f"**태그:** {', '.join(doc_meta['tags'])}")
-                        content = load_markdown_file(fname)
-                        st.text_area("문서 내용", value=content, height=200, disabled=True)
+                render_document_viewer(metadata)
             else:
                 st.info("등록된 문서가 없습니다.")
 
@@ -250,7 +494,7 @@ def main():
                 if not title:
                     st.error("제목을 입력하세요.")
                 else:
-                    file_name = create_document(title, category, tags, content)
+                    file_name = create_document(title, category, tags, content, metadata=metadata)
                     st.success(f"문서 '{file_name}'이 추가되었습니다.")
 
         elif action == "수정":
@@ -265,7 +509,7 @@ def main():
 
                 if st.button("수정 완료"):
                     tags_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
-                    create_document(title, category, tags_list, content)
+                    create_document(title, category, tags_list, content, metadata=metadata)
                     st.success(f"문서 '{file_name}'이 수정되었습니다.")
             else:
                 st.info("수정할 문서가 없습니다.")
@@ -275,7 +519,7 @@ def main():
             if metadata:
                 file_name = st.selectbox("삭제할 문서 선택", list(metadata.keys()))
                 if st.button("문서 삭제"):
-                    delete_document(file_name)
+                    delete_document(file_name, metadata=metadata)
                     st.success(f"문서 '{file_name}'이 삭제되었습니다.")
             else:
                 st.info("삭제할 문서가 없습니다.")
@@ -286,7 +530,7 @@ def main():
     elif menu == "템플릿 관리":
         st.header("템플릿 관리")
         action = st.selectbox("작업 선택", ["보기", "추가", "수정", "삭제"])
-        templates = load_json(TEMPLATES_FILE)
+        templates = load_json_cached(TEMPLATES_FILE)
 
         if action == "보기":
             st.subheader("템플릿 보기")
@@ -342,7 +586,7 @@ def main():
     elif menu == "프롬프트 관리":
         st.header("프롬프트 관리")
         action = st.selectbox("작업 선택", ["보기", "추가", "수정", "삭제"])
-        prompts = load_json(PROMPTS_FILE)
+        prompts = load_json_cached(PROMPTS_FILE)
 
         if action == "보기":
             st.subheader("프롬프트 보기")
@@ -393,7 +637,7 @@ def main():
     elif menu == "키워드 관리":
         st.header("키워드 관리")
         action = st.selectbox("작업 선택", ["보기", "추가", "수정", "삭제"])
-        keywords = load_json(KEYWORDS_FILE)
+        keywords = load_json_cached(KEYWORDS_FILE)
 
         if action == "보기":
             st.subheader("키워드 보기")